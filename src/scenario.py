@@ -8,21 +8,31 @@ logic here, just the "world" the engine operates in.
 """
 
 from dataclasses import dataclass
-from typing import List, Dict
+from typing import Dict, List, Sequence, Tuple
 
-import numpy as np  # used later for trajectory generation, imported here once
+import numpy as np
 
 
 # --- Core data types ---------------------------------------------------------
 
 
-@dataclass
-class Waypoint:
-    """Single 4D waypoint along a drone trajectory."""
-    x: float          # meters (local X in hub frame)
-    y: float          # meters (local Y in hub frame)
-    z: float          # meters AGL (altitude)
-    time: float       # seconds from mission start
+# A trajectory is stored as one packed NumPy structured array instead of a
+# list of per-waypoint Python objects: geometry code reads whole columns
+# (wps["x"], wps["t"], ...) without a Python-level attribute loop, and the
+# packed float32 layout can be handed to the jitted kernels without copying.
+WAYPOINT_DTYPE = np.dtype(
+    [
+        ("x", "f4"),   # meters (local X in hub frame)
+        ("y", "f4"),   # meters (local Y in hub frame)
+        ("z", "f4"),   # meters AGL (altitude)
+        ("t", "f4"),   # seconds from mission start
+    ]
+)
+
+
+def make_waypoints(rows: Sequence[Tuple[float, float, float, float]]) -> np.ndarray:
+    """Build a waypoint array from (x, y, z, time) tuples."""
+    return np.array(rows, dtype=WAYPOINT_DTYPE)
 
 
 @dataclass
@@ -31,11 +41,15 @@ class DeconflictionConfig:
     Tunable configuration for the strategic clearance engine.
 
     safety_radius_m:     minimum allowed 3D separation between drones.
-    samples_per_segment: how densely to sample between waypoints when
-                         constructing trajectories for distance checks.
+    samples_per_segment: how densely to sample between waypoints when a
+                         fixed per-segment count is requested explicitly.
+    max_step_m:          target spacing between adaptive trajectory samples;
+                         keeping it at half the safety radius means the
+                         sampled check cannot step over a violation.
     """
     safety_radius_m: float = 25.0      # assignment safety radius (meters)
     samples_per_segment: int = 10      # reasonable default for tests/demo
+    max_step_m: float = 12.5           # safety_radius_m / 2
 
 
 # Single global config instance used by the rest of the code
@@ -56,13 +70,15 @@ def define_perimeter_scan_mission() -> Dict:
     perimeter_alt = 60.0  # low layer, below most transit traffic
     return {
         "mission_id": "night_perimeter_scan_pune_hub_v1",
-        "waypoints": [
-            # SW -> SE -> NE -> NW (warehouse perimeter)
-            Waypoint(0,   -20, perimeter_alt,   0),   # SW
-            Waypoint(120, -20, perimeter_alt,  60),   # SE
-            Waypoint(120,  80, perimeter_alt, 180),   # NE
-            Waypoint(0,    80, perimeter_alt, 300),   # NW
-        ],
+        "waypoints": make_waypoints(
+            [
+                # SW -> SE -> NE -> NW (warehouse perimeter)
+                (0,   -20, perimeter_alt,   0),   # SW
+                (120, -20, perimeter_alt,  60),   # SE
+                (120,  80, perimeter_alt, 180),   # NE
+                (0,    80, perimeter_alt, 300),   # NW
+            ]
+        ),
         "t_start": 0,
         "t_end": 600,  # 10‑minute clearance window
     }
@@ -83,30 +99,36 @@ def define_scheduled_traffic() -> List[Dict]:
         {
             "id": "early_cargo_south_corridor",
             "role": "cargo",
-            "waypoints": [
-                Waypoint(-50, -30, 80, 120),
-                Waypoint(200, -30, 80, 260),
-            ],
+            "waypoints": make_waypoints(
+                [
+                    (-50, -30, 80, 120),
+                    (200, -30, 80, 260),
+                ]
+            ),
             "t_start": 120,
             "t_end": 260,
         },
         {
             "id": "urban_diag_delivery",
             "role": "delivery",
-            "waypoints": [
-                Waypoint(-50, -50, 100, 100),
-                Waypoint(200, 200, 100, 400),
-            ],
+            "waypoints": make_waypoints(
+                [
+                    (-50, -50, 100, 100),
+                    (200, 200, 100, 400),
+                ]
+            ),
             "t_start": 100,
             "t_end": 400,
         },
         {
             "id": "emergency_overpass_lane",
             "role": "emergency",
-            "waypoints": [
-                Waypoint(0,   150, 130,  50),
-                Waypoint(150, -50, 130, 250),
-            ],
+            "waypoints": make_waypoints(
+                [
+                    (0,   150, 130,  50),
+                    (150, -50, 130, 250),
+                ]
+            ),
             "t_start": 50,
             "t_end": 250,
         },
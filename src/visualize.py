@@ -8,27 +8,37 @@ This plot is used in the demo video to show:
 - the overall qualitative risk level for the mission
 """
 
-from typing import Dict
+from typing import Any, Dict, Optional
 
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D  # noqa: F401 – required for 3D projection
-
-from scenario import define_scheduled_traffic
+from scenario import define_perimeter_scan_mission, define_scheduled_traffic
 from geometry import interpolate_trajectory_3d
-from engine import evaluate_mission_clearance
+from engine import ClearanceResult, evaluate_mission_clearance
 
 
-def plot_3d_trajectories(result: Dict) -> None:
+def plot_3d_trajectories(
+    result: ClearanceResult,
+    mission: Optional[Dict[str, Any]] = None,
+) -> None:
     """
     Render a 3D view of the mission and all scheduled traffic.
 
-    result: output dictionary from evaluate_mission_clearance.
+    result:  ClearanceResult from evaluate_mission_clearance.
+    mission: the mission dict that was evaluated; defaults to the standard
+             perimeter scan (the result itself stays lightweight and does
+             not carry the waypoints).
     """
+    # matplotlib is imported lazily: it costs hundreds of milliseconds and
+    # is only needed once someone actually asks for a render, so importing
+    # this module (e.g. for type hints or tests) stays cheap.
+    import matplotlib.pyplot as plt
+    from mpl_toolkits.mplot3d import Axes3D  # noqa: F401 – required for 3D projection
+
     fig = plt.figure(figsize=(10, 7))
     ax = fig.add_subplot(111, projection="3d")
 
     # --- Primary mission: perimeter scan drone --------------------------------
-    mission = result["mission"]
+    if mission is None:
+        mission = define_perimeter_scan_mission()
     traj_p, _ = interpolate_trajectory_3d(mission["waypoints"])
     ax.plot(
         traj_p[:, 0],
@@ -52,7 +62,7 @@ def plot_3d_trajectories(result: Dict) -> None:
         )
 
     # --- Axes formatting and labels -------------------------------------------
-    ax.set_title(f"3D Trajectories (risk={result['risk_level']})")
+    ax.set_title(f"3D Trajectories (risk={result.risk_level})")
     ax.set_xlabel("X [m]")
     ax.set_ylabel("Y [m]")
     ax.set_zlabel("Z (altitude) [m]")